@@ -3,10 +3,18 @@ Advanced SDO Examples - Building on the basic fetcher
 Demonstrates monitoring, time-series, and composite image creation
 """
 
-import time
+import argparse
+import asyncio
+import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from sdo_fetcher_v2 import SDOFetcher
+from sdo_provider import create_session, prewarm_session
+
+
+# One connection pool for every helper, so running several sets in a row
+# reuses warm keep-alive connections instead of opening new ones.
+_shared_session = create_session()
 
 
 def continuous_monitor(interval_seconds=300, sources=None, provider="auto"):
@@ -20,7 +28,7 @@ def continuous_monitor(interval_seconds=300, sources=None, provider="auto"):
     if sources is None:
         sources = ["AIA_171"]
     
-    fetcher = SDOFetcher(output_dir="monitoring")
+    fetcher = SDOFetcher(output_dir="monitoring", skip_unchanged=True, metadata_manifest=True, session=_shared_session)
     
     print(f"Starting continuous monitoring...")
     print(f"Sources: {', '.join(sources)}")
@@ -29,7 +37,23 @@ def continuous_monitor(interval_seconds=300, sources=None, provider="auto"):
     print(f"Press Ctrl+C to stop\n")
     
     iteration = 0
-    try:
+
+    async def fetch_one(source):
+        try:
+            # The fetcher is blocking, so run each source on a worker thread
+            # and let every source of an iteration download in parallel.
+            result = await asyncio.to_thread(fetcher.get_latest_image_direct, source, provider=provider)
+            if result and result.get("unchanged"):
+                print(f"• {source} unchanged since {result.get('observation_time')}")
+            elif result:
+                print(f"✓ {source} downloaded successfully via {result.get('provider_name', result.get('provider', 'unknown'))}")
+            else:
+                print(f"✗ {source} failed")
+        except Exception as e:
+            print(f"✗ Error downloading {source}: {e}")
+
+    async def monitor():
+        nonlocal iteration
         while True:
             iteration += 1
             timestamp = datetime.now(timezone.utc).isoformat()
@@ -38,22 +62,18 @@ def continuous_monitor(interval_seconds=300, sources=None, provider="auto"):
             print(f"Iteration #{iteration} at {timestamp}")
             print(f"{'='*60}")
             
-            for source in sources:
-                try:
-                    result = fetcher.get_latest_image_direct(source, provider=provider)
-                    if result:
-                        print(f"✓ {source} downloaded successfully via {result.get('provider_name', result.get('provider', 'unknown'))}")
-                    else:
-                        print(f"✗ {source} failed")
-                except Exception as e:
-                    print(f"✗ Error downloading {source}: {e}")
+            await asyncio.gather(*(fetch_one(source) for source in sources))
             
             print(f"\nWaiting {interval_seconds} seconds until next download...")
-            time.sleep(interval_seconds)
-            
-    except KeyboardInterrupt:
+            await asyncio.sleep(interval_seconds)
+
+    try:
+        asyncio.run(monitor())
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print(f"\n\nMonitoring stopped. Downloaded {iteration} sets of images.")
         print(f"Images saved in: {fetcher.output_dir}")
+    finally:
+        fetcher.close()
 
 
 def download_comparison_set():
@@ -75,7 +95,7 @@ def download_comparison_set():
         "HMI_Continuum",  # Visible surface
     ]
     
-    fetcher = SDOFetcher(output_dir="comparison_set")
+    fetcher = SDOFetcher(output_dir="comparison_set", session=_shared_session)
     results = fetcher.download_multiple(sources, provider="auto")
     
     print("\n" + "="*60)
@@ -109,7 +129,7 @@ def download_active_region_set():
         "HMI_Magnetogram",  # Magnetic field
     ]
     
-    fetcher = SDOFetcher(output_dir="active_regions")
+    fetcher = SDOFetcher(output_dir="active_regions", session=_shared_session)
     results = fetcher.download_multiple(sources, provider="auto")
     
     print("\nActive region monitoring complete!")
@@ -129,7 +149,7 @@ def quick_space_weather_check():
     print("SPACE WEATHER QUICK CHECK")
     print("="*60 + "\n")
     
-    fetcher = SDOFetcher(output_dir="space_weather")
+    fetcher = SDOFetcher(output_dir="space_weather", session=_shared_session)
     
     # Get the most relevant images for space weather
     sources = ["AIA_193", "HMI_Magnetogram"]
@@ -168,7 +188,7 @@ def download_prominence_monitoring():
         "HMI_Continuum",  # Visible disk
     ]
     
-    fetcher = SDOFetcher(output_dir="prominences")
+    fetcher = SDOFetcher(output_dir="prominences", session=_shared_session)
     results = fetcher.download_multiple(sources, provider="auto")
     
     print("\nProminence monitoring complete!")
@@ -187,8 +207,7 @@ Automated SDO Monitoring Script
 Runs continuously and downloads images every 15 minutes
 """
 
-import time
-from datetime import datetime, timezone
+import asyncio
 from sdo_fetcher_v2 import SDOFetcher
 import logging
 
@@ -202,8 +221,18 @@ logging.basicConfig(
     ]
 )
 
-def main():
-    fetcher = SDOFetcher(output_dir="continuous_monitoring")
+async def fetch_one(fetcher, source):
+    try:
+        result = await asyncio.to_thread(fetcher.get_latest_image_direct, source, provider="auto")
+        if result and result.get("unchanged"):
+            logging.info(f"• {source} unchanged since {result.get('observation_time')}")
+        elif result:
+            logging.info(f"✓ Downloaded {source} via {result.get('provider_name', result.get('provider', 'unknown'))}")
+    except Exception as e:
+        logging.error(f"✗ Failed to download {source}: {e}")
+
+async def monitor():
+    fetcher = SDOFetcher(output_dir="continuous_monitoring", skip_unchanged=True, metadata_manifest=True)
     sources = ["AIA_171", "AIA_193", "HMI_Magnetogram"]
     interval = 900  # 15 minutes
     
@@ -212,28 +241,28 @@ def main():
     logging.info(f"Interval: {interval} seconds")
     
     iteration = 0
-    while True:
-        try:
-            iteration += 1
-            logging.info(f"=== Iteration {iteration} ===")
-            
-            for source in sources:
-                try:
-                    result = fetcher.get_latest_image_direct(source, provider="auto")
-                    if result:
-                        logging.info(f"✓ Downloaded {source} via {result.get('provider_name', result.get('provider', 'unknown'))}")
-                except Exception as e:
-                    logging.error(f"✗ Failed to download {source}: {e}")
-            
-            logging.info(f"Waiting {interval} seconds...")
-            time.sleep(interval)
-            
-        except KeyboardInterrupt:
-            logging.info("Monitoring stopped by user")
-            break
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            time.sleep(60)  # Wait 1 minute before retrying
+    try:
+        while True:
+            try:
+                iteration += 1
+                logging.info(f"=== Iteration {iteration} ===")
+                
+                await asyncio.gather(*(fetch_one(fetcher, source) for source in sources))
+                
+                logging.info(f"Waiting {interval} seconds...")
+                await asyncio.sleep(interval)
+                
+            except Exception as e:
+                logging.error(f"Unexpected error: {e}")
+                await asyncio.sleep(60)  # Wait 1 minute before retrying
+    finally:
+        fetcher.close()
+
+def main():
+    try:
+        asyncio.run(monitor())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        logging.info("Monitoring stopped by user")
 
 if __name__ == "__main__":
     main()
@@ -248,44 +277,65 @@ if __name__ == "__main__":
 
 
 def main():
-    """Main menu for advanced examples"""
-    print("\n" + "="*60)
-    print("SDO Advanced Examples")
-    print("="*60)
-    print("\n1. Download multi-wavelength comparison set")
-    print("2. Download active region/flare observation set")
-    print("3. Quick space weather check")
-    print("4. Download prominence monitoring set")
-    print("5. Start continuous monitoring (Ctrl+C to stop)")
-    print("6. Create monitoring daemon script")
-    print("7. Exit")
+    """Command-line interface for the advanced examples"""
+    parser = argparse.ArgumentParser(
+        description="Advanced SDO examples: observation sets, monitoring, and daemons",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Download a multi-wavelength comparison set
+  python sdo_advanced_examples.py compare
+  
+  # Quick space weather check
+  python sdo_advanced_examples.py weather
+  
+  # Monitor two wavelengths every 10 minutes
+  python sdo_advanced_examples.py monitor --interval 600 --sources AIA_171,AIA_304
+  
+  # Write a standalone monitoring_daemon.py
+  python sdo_advanced_examples.py daemon
+        """
+    )
+    
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.add_parser("compare", help="Download a multi-wavelength comparison set")
+    subparsers.add_parser("active", help="Download an active region/flare observation set")
+    subparsers.add_parser("weather", help="Quick space weather check")
+    subparsers.add_parser("prominence", help="Download a prominence monitoring set")
+    subparsers.add_parser("daemon", help="Create a monitoring daemon script")
+    
+    monitor_parser = subparsers.add_parser("monitor", help="Continuously monitor (Ctrl+C to stop)")
+    monitor_parser.add_argument('--interval', '-i', type=int, default=300,
+                                help='Seconds between downloads (default: 300)')
+    monitor_parser.add_argument('--sources', '-s', default='AIA_171',
+                                help='Comma-separated sources to monitor (default: AIA_171)')
+    monitor_parser.add_argument('--provider', '-p', default='auto',
+                                help='Data provider: auto, lmsal, jsoc, nasa, helioviewer')
+    
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
-    choice = input("\nSelect option (1-7): ").strip()
+    if args.command in ("compare", "active", "weather", "prominence", "monitor"):
+        # The helpers' fetchers share _shared_session and do not warm it
+        # themselves, so open its connections once here.
+        prewarm_session(_shared_session, args.provider if args.command == "monitor" else "auto")
     
-    if choice == "1":
+    if args.command == "compare":
         download_comparison_set()
-    elif choice == "2":
+    elif args.command == "active":
         download_active_region_set()
-    elif choice == "3":
+    elif args.command == "weather":
         quick_space_weather_check()
-    elif choice == "4":
+    elif args.command == "prominence":
         download_prominence_monitoring()
-    elif choice == "5":
-        sources = input("Enter sources (comma-separated, or press Enter for AIA_171): ").strip()
-        if sources:
-            sources = [s.strip() for s in sources.split(",")]
-        else:
-            sources = ["AIA_171"]
-        interval = input("Enter interval in seconds (default 300): ").strip()
-        interval = int(interval) if interval else 300
-        provider = input("Enter provider (auto/lmsal/jsoc/nasa/helioviewer, default auto): ").strip() or "auto"
-        continuous_monitor(interval, sources, provider)
-    elif choice == "6":
+    elif args.command == "monitor":
+        sources = [s.strip() for s in args.sources.split(",") if s.strip()]
+        continuous_monitor(args.interval, sources, args.provider)
+    elif args.command == "daemon":
         create_monitoring_script()
-    elif choice == "7":
-        print("Goodbye!")
     else:
-        print("Invalid choice")
+        parser.print_help()
 
 
 if __name__ == "__main__":
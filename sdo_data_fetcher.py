@@ -8,10 +8,10 @@ using the Helioviewer API. It supports multiple instruments and wavelengths.
 import requests
 from datetime import datetime, timedelta, timezone
 import json
-from pathlib import Path
+import logging
 from typing import Optional, Dict
 import argparse
-from sdo_provider import SDOProviderClient, SDO_SOURCES
+from sdo_provider import SDOProviderClient, SDO_SOURCES, SOURCE_KEYS, VALID_SOURCES, fetch_sources_concurrently
 
 
 class SDODataFetcher:
@@ -22,13 +22,13 @@ class SDODataFetcher:
     
     def __init__(self, output_dir: str = "sdo_data"):
         """Initialize the fetcher with an output directory"""
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
         self.provider_client = SDOProviderClient(output_dir=output_dir)
+        # The provider client already created the directory; share its Path.
+        self.output_dir = self.provider_client.output_dir
     
     def get_latest_available_date(self, source: str = "AIA_171", provider: str = "auto") -> Optional[str]:
         """Query the API for the latest available SDO observation time"""
-        timestamp = self.provider_client.get_latest_timestamp(source=source, provider=provider)
+        timestamp = self.get_latest_data_timestamp(source=source, provider=provider)
         if timestamp:
             print(f"Latest SDO data available: {timestamp}")
             return timestamp
@@ -49,8 +49,8 @@ class SDODataFetcher:
             Dictionary with image metadata and file path
         """
         _ = image_scale
-        if source not in self.SDO_SOURCES:
-            raise ValueError(f"Invalid source. Choose from: {list(self.SDO_SOURCES.keys())}")
+        if source not in VALID_SOURCES:
+            raise ValueError(f"Invalid source. Choose from: {SOURCE_KEYS}")
 
         print(f"Fetching latest {source} data...")
         print(f"Description: {self.SDO_SOURCES[source]['description']}")
@@ -64,22 +64,23 @@ class SDODataFetcher:
             print(f"Error getting latest timestamp: {e}")
             return None
     
-    def download_multiple_wavelengths(self, sources: list = None, provider: str = "auto"):
+    def download_multiple_wavelengths(self, sources: list = None, provider: str = "auto", retries: int = 1):
         """
         Download images from multiple SDO sources
         
         Args:
             sources: List of source identifiers (defaults to common wavelengths)
+            retries: Extra attempts per source after every provider failed
         """
         if sources is None:
             sources = ["AIA_171", "AIA_193", "AIA_304", "HMI_Magnetogram"]
         
-        results = []
-        for source in sources:
-            print(f"\n{'='*60}")
-            result = self.get_latest_image(source, provider=provider)
-            if result:
-                results.append(result)
+        ordered = fetch_sources_concurrently(
+            lambda source: self.get_latest_image(source, provider=provider),
+            sources,
+            retries=retries,
+        )
+        results = [result for result in ordered if result]
         
         print(f"\n{'='*60}")
         print(f"Downloaded {len(results)} images successfully!")
@@ -168,6 +169,8 @@ Examples:
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # List available sources and exit
     if args.list:
         SDODataFetcher.list_available_sources()
@@ -3,10 +3,13 @@ SDO Data Fetcher v2 - Alternative Implementation
 Uses NASA's Helioviewer.org latest images API
 """
 
-from pathlib import Path
 from typing import Optional, Dict
 import argparse
-from sdo_provider import SDOProviderClient, SDO_SOURCES
+import logging
+from sdo_sources import SDO_SOURCES, SOURCE_KEYS, list_providers
+
+
+logger = logging.getLogger(__name__)
 
 
 class SDOFetcher:
@@ -14,10 +17,34 @@ class SDOFetcher:
     
     SDO_SOURCES = SDO_SOURCES
     
-    def __init__(self, output_dir: str = "sdo_data"):
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
-        self.provider_client = SDOProviderClient(output_dir=output_dir)
+    def __init__(
+        self,
+        output_dir: str = "sdo_data",
+        skip_unchanged: bool = False,
+        metadata_manifest: bool = False,
+        session=None,
+        prewarm_provider: Optional[str] = "auto",
+    ):
+        # Imported here so that --list and callers that only need the source
+        # catalog never load requests.
+        from sdo_provider import SDOProviderClient
+
+        self.provider_client = SDOProviderClient(
+            output_dir=output_dir,
+            skip_unchanged=skip_unchanged,
+            metadata_manifest=metadata_manifest,
+            session=session,
+        )
+        # The provider client already created the directory; share its Path.
+        self.output_dir = self.provider_client.output_dir
+        # A caller-supplied session is shared between fetchers; the caller warms
+        # it once with sdo_provider.prewarm_session instead of every instance.
+        if session is None and prewarm_provider:
+            self.provider_client.prewarm_connections(prewarm_provider)
+
+    def close(self):
+        """Flush any buffered metadata manifest to disk"""
+        self.provider_client.close()
     
     def get_latest_image_png(
         self,
@@ -59,13 +86,11 @@ class SDOFetcher:
             width=width,
             image_type=image_type,
         )
-        if result:
-            print(f"\n{'='*60}")
-            print(f"Success! Downloaded latest SDO {source} image")
-            print(f"Provider: {result.get('provider_name', result.get('provider', 'unknown'))}")
+        if result and not result.get("unchanged"):
+            logger.info(f"Success! Downloaded latest SDO {source} image")
+            logger.info(f"Provider: {result.get('provider_name', result.get('provider', 'unknown'))}")
             if result.get("observation_time"):
-                print(f"Observation time: {result['observation_time']}")
-            print(f"{'='*60}\n")
+                logger.info(f"Observation time: {result['observation_time']}")
         return result
     
     def download_multiple(
@@ -74,28 +99,29 @@ class SDOFetcher:
         provider: str = "auto",
         width: int = 1024,
         image_type: str = "png",
+        max_workers: int = 8,
     ):
-        """Download multiple wavelengths"""
+        """Download multiple wavelengths concurrently"""
         if sources is None:
             sources = ["AIA_171", "AIA_193", "AIA_304", "HMI_Magnetogram"]
         
-        print(f"\nDownloading {len(sources)} different SDO images...")
-        print("="*60)
+        from sdo_provider import fetch_sources_concurrently
+
+        logger.info(f"Downloading {len(sources)} different SDO images...")
         
-        results = []
-        for source in sources:
-            result = self.get_latest_image_direct(
+        ordered = fetch_sources_concurrently(
+            lambda source: self.get_latest_image_direct(
                 source,
                 provider=provider,
                 width=width,
                 image_type=image_type,
-            )
-            if result:
-                results.append(result)
+            ),
+            sources,
+            max_workers=max_workers,
+        )
+        results = [result for result in ordered if result]
         
-        print(f"\n{'='*60}")
-        print(f"Successfully downloaded {len(results)}/{len(sources)} images")
-        print(f"{'='*60}\n")
+        logger.info(f"Successfully downloaded {len(results)}/{len(sources)} images")
         
         return results
 
@@ -180,20 +206,30 @@ def main():
                        help='Sample cadence in minutes for --datetime (default: 15)')
     parser.add_argument('--width', type=int, default=1024,
                        help='Requested image width in pixels for Helioviewer downloads (default: 1024)')
+    parser.add_argument('--workers', type=int, default=8,
+                       help='Parallel downloads for --multiple (default: 8)')
     parser.add_argument('--image-type', choices=['png', 'jpg', 'webp'], default='png',
                        help='Requested image type for Helioviewer downloads (default: png)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Log per-download progress (provider attempts, saved files)')
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
+    
     if args.list:
         SDOFetcher.list_sources()
-        SDOProviderClient.list_providers()
+        list_providers()
         return
     
-    fetcher = SDOFetcher(output_dir=args.output)
+    # Historical fetches only ever use Helioviewer.
+    fetcher = SDOFetcher(
+        output_dir=args.output,
+        prewarm_provider="helioviewer" if args.target_datetime else args.provider,
+    )
 
     if args.target_datetime:
-        sources = list(SDO_SOURCES.keys()) if args.all else [args.source]
+        sources = list(SOURCE_KEYS) if args.all else [args.source]
         if args.hours > 0 and args.cadence > 0:
             manifest = fetcher.download_time_series(
                 sources=sources,
@@ -207,24 +243,35 @@ def main():
             print(f"Manifest: {manifest['manifest_filepath']}")
         else:
             for source in sources:
-                fetcher.download_at_time(
+                result = fetcher.download_at_time(
                     source=source,
                     target_time=args.target_datetime,
                     timezone_mode=args.timezone,
                     width=args.width,
                     image_type=args.image_type,
                 )
+                if result:
+                    print(f"Saved: {result['filepath']}")
         return
     
     if args.multiple:
-        fetcher.download_multiple(provider=args.provider, width=args.width, image_type=args.image_type)
+        results = fetcher.download_multiple(
+            provider=args.provider,
+            width=args.width,
+            image_type=args.image_type,
+            max_workers=max(1, args.workers),
+        )
     else:
-        fetcher.get_latest_image_direct(
+        result = fetcher.get_latest_image_direct(
             source=args.source,
             provider=args.provider,
             width=args.width,
             image_type=args.image_type,
         )
+        results = [result] if result else []
+    
+    for result in results:
+        print(f"Saved: {result['filepath']}")
 
 
 if __name__ == "__main__":
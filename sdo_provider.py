@@ -2,130 +2,109 @@
 Shared SDO data provider logic with automatic fallback.
 """
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
+import hashlib
 import json
+import logging
 from pathlib import Path
+import os
+import threading
 import time
 from typing import Callable, Dict, Iterable, List, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 
+from sdo_sources import PROVIDER_LABELS, SDO_SOURCES, SOURCE_KEYS, VALID_SOURCES, list_providers
 
-SDO_SOURCES = {
-    "AIA_94": {
-        "sourceId": 8,
-        "name": "AIA 94",
-        "wavelength": "94Å",
-        "description": "AIA 94 Å - Hot flare plasma",
-        "nasa_code": "0094",
-        "lmsal_code": "0094",
-    },
-    "AIA_131": {
-        "sourceId": 9,
-        "name": "AIA 131",
-        "wavelength": "131Å",
-        "description": "AIA 131 Å - Flaring regions",
-        "nasa_code": "0131",
-        "lmsal_code": "0131",
-    },
-    "AIA_171": {
-        "sourceId": 10,
-        "name": "AIA 171",
-        "wavelength": "171Å",
-        "description": "AIA 171 Å - Quiet corona and coronal loops",
-        "nasa_code": "0171",
-        "lmsal_code": "0171",
-    },
-    "AIA_193": {
-        "sourceId": 11,
-        "name": "AIA 193",
-        "wavelength": "193Å",
-        "description": "AIA 193 Å - Hot plasma in active regions",
-        "nasa_code": "0193",
-        "lmsal_code": "0193",
-    },
-    "AIA_211": {
-        "sourceId": 12,
-        "name": "AIA 211",
-        "wavelength": "211Å",
-        "description": "AIA 211 Å - Active regions",
-        "nasa_code": "0211",
-        "lmsal_code": "0211",
-    },
-    "AIA_304": {
-        "sourceId": 13,
-        "name": "AIA 304",
-        "wavelength": "304Å",
-        "description": "AIA 304 Å - Chromosphere and prominence",
-        "nasa_code": "0304",
-        "lmsal_code": "0304",
-    },
-    "AIA_335": {
-        "sourceId": 14,
-        "name": "AIA 335",
-        "wavelength": "335Å",
-        "description": "AIA 335 Å - Active regions",
-        "nasa_code": "0335",
-        "lmsal_code": "0335",
-    },
-    "AIA_1600": {
-        "sourceId": 15,
-        "name": "AIA 1600",
-        "wavelength": "1600Å",
-        "description": "AIA 1600 Å - Upper photosphere",
-        "nasa_code": "1600",
-        "lmsal_code": "1600",
-    },
-    "AIA_1700": {
-        "sourceId": 16,
-        "name": "AIA 1700",
-        "wavelength": "1700Å",
-        "description": "AIA 1700 Å - Temperature minimum",
-        "nasa_code": "1700",
-        "lmsal_code": "1700",
-    },
-    "AIA_4500": {
-        "sourceId": 17,
-        "name": "AIA 4500",
-        "wavelength": "4500Å",
-        "description": "AIA 4500 Å - Visible light photosphere",
-        "nasa_code": "4500",
-        "lmsal_code": "4500",
-    },
-    "HMI_Continuum": {
-        "sourceId": 18,
-        "name": "HMI Continuum",
-        "wavelength": "Continuum",
-        "description": "HMI Continuum - Solar surface",
-        "nasa_code": "HMIIC",
-        "lmsal_code": "_HMI_cont_aiascale",
-        "jsoc_path": "/data/hmi/images/latest/HMI_latest_Int_1024x1024.gif",
-        "jsoc_timestamp_key": "continuum",
-    },
-    "HMI_Magnetogram": {
-        "sourceId": 19,
-        "name": "HMI Magnetogram",
-        "wavelength": "Magnetogram",
-        "description": "HMI Magnetogram - Magnetic field",
-        "nasa_code": "HMII",
-        "lmsal_code": "_HMImag",
-        "jsoc_path": "/data/hmi/images/latest/HMI_latest_Mag_1024x1024.gif",
-        "jsoc_timestamp_key": "magnetogram",
-    },
+try:
+    import orjson
+except ImportError:  # optional: faster metadata serialization when installed
+    orjson = None
+
+try:
+    import brotli  # noqa: F401  (urllib3 decodes "br" bodies when this is importable)
+except ImportError:  # optional: smaller JSON API responses when installed
+    brotli = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# Fixed per-source URLs, built once at import instead of on every request.
+NASA_LATEST_URLS = {
+    key: (
+        f"http://sdo.gsfc.nasa.gov/assets/img/latest/latest_1024_{info['nasa_code']}.jpg",
+        f"https://sdo.gsfc.nasa.gov/assets/img/latest/latest_1024_{info['nasa_code']}.jpg",
+    )
+    for key, info in SDO_SOURCES.items()
+    if info.get("nasa_code")
+}
+LMSAL_URL_TEMPLATES = {
+    key: (
+        f"http://suntoday.lmsal.com/sdomedia/SunInTime/{{date_path}}/t{info['lmsal_code']}.jpg",
+        f"https://suntoday.lmsal.com/sdomedia/SunInTime/{{date_path}}/t{info['lmsal_code']}.jpg",
+    )
+    for key, info in SDO_SOURCES.items()
+    if info.get("lmsal_code")
+}
+JSOC_LATEST_URLS = {
+    key: f"https://jsoc1.stanford.edu{info['jsoc_path']}"
+    for key, info in SDO_SOURCES.items()
+    if info.get("jsoc_path")
 }
 
 
-PROVIDER_LABELS = {
-    "lmsal": "LMSAL Sun Today",
-    "jsoc": "Stanford JSOC",
-    "nasa": "NASA SDO",
-    "helioviewer": "Helioviewer API",
+# Connection each provider's first request uses, for warming up DNS/TCP/TLS.
+PROVIDER_WARMUP_URLS = {
+    "lmsal": "http://suntoday.lmsal.com/",
+    "jsoc": "https://jsoc1.stanford.edu/",
+    "nasa": "http://sdo.gsfc.nasa.gov/",
+    "helioviewer": "https://api.helioviewer.org/",
 }
 
 
 AUTO_PROVIDER_ORDER = ("lmsal", "jsoc", "nasa", "helioviewer")
 AUTO_PROVIDER_ORDER_HIGHRES = ("helioviewer", "lmsal", "jsoc", "nasa")
 
+# Latest-timestamp lookups are reused for this long before re-querying providers.
+TIMESTAMP_CACHE_SECONDS = 60
+
+# AIA publishes a new frame roughly every 12 s, so with skip_unchanged a source
+# checked more recently than this is answered from the last result.
+LATEST_RECHECK_SECONDS = 12
+
+# Helioviewer's getDataSources tree covers every source, so one copy is shared
+# by all latest-date lookups for this long.
+DATA_SOURCES_CACHE_SECONDS = 300
+
+# Seconds to wait for a TCP/TLS connection. Connection failures are not retried
+# by the session, so an unreachable URL costs exactly this long before the next
+# mirror or provider is tried; each call sets its own read timeout to suit the
+# payload size.
+CONNECT_TIMEOUT = 5
+
+# Image bodies are copied to disk in blocks of this size.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Images are already compressed, so ask for them untouched; JSON endpoints use
+# the session's negotiation, which adds Brotli when urllib3 can decode it.
+IMAGE_REQUEST_HEADERS = {"Accept-Encoding": "identity"}
+SESSION_HEADERS = {
+    "Accept-Encoding": "br, gzip, deflate" if brotli is not None else "gzip, deflate",
+    "User-Agent": "sdo-fetcher/2.0",
+}
+
+# Append-only metadata log used instead of per-image sidecars when requested.
+METADATA_MANIFEST_NAME = "manifest.jsonl"
+
+# Content digest and metadata of the last image saved per source, kept so that
+# skip_unchanged can drop byte-identical re-downloads across runs.
+DIGESTS_NAME = ".digests.json"
+
 
 def parse_target_datetime(value: Union[str, datetime], timezone_mode: str = "utc") -> datetime:
     """Parse a target time and return an aware UTC datetime."""
@@ -160,6 +139,12 @@ def utc_slug(value: datetime) -> str:
     return value.astimezone(timezone.utc).strftime("%Y%m%d_%H%M%SZ")
 
 
+def _utc_stamps() -> tuple[str, str]:
+    """Return the current UTC time as a filename stamp and an ISO 8601 string."""
+    now = time.gmtime()
+    return time.strftime("%Y%m%d_%H%M%S", now), time.strftime("%Y-%m-%dT%H:%M:%S+00:00", now)
+
+
 def _parse_helioviewer_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
@@ -172,13 +157,270 @@ def _parse_helioviewer_datetime(value: Optional[str]) -> Optional[datetime]:
     return parsed.astimezone(timezone.utc)
 
 
+def _fetch_after(delay: float, fetch: Callable[[str], Optional[Dict]], source: str) -> Optional[Dict]:
+    time.sleep(delay)
+    return fetch(source)
+
+
+def fetch_sources_concurrently(
+    fetch: Callable[[str], Optional[Dict]],
+    sources: List[str],
+    max_workers: int = 8,
+    retries: int = 0,
+) -> List[Optional[Dict]]:
+    """Run *fetch* for every source on a thread pool and return results in input order.
+
+    All sources are submitted up front and completions are consumed as they
+    land. A source that returns nothing is resubmitted to the same pool after
+    an exponential backoff, up to *retries* extra times, so one slow or flaky
+    source never serializes the batch.
+    """
+    if not sources:
+        return []
+
+    ordered: List[Optional[Dict]] = [None] * len(sources)
+    with ThreadPoolExecutor(max_workers=min(len(sources), max_workers)) as executor:
+        pending = {
+            executor.submit(fetch, source): (index, 0)
+            for index, source in enumerate(sources)
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, attempt = pending.pop(future)
+                result = future.result()
+                if result or attempt >= retries:
+                    ordered[index] = result
+                    continue
+                delay = 0.5 * 2 ** attempt
+                logger.info(f"Retrying {sources[index]} in {delay:.1f}s...")
+                retry = executor.submit(_fetch_after, delay, fetch, sources[index])
+                pending[retry] = (index, attempt + 1)
+    return ordered
+
+
+def create_session() -> requests.Session:
+    """Create a pooled HTTP session that several clients can share."""
+    session = requests.Session()
+    session.headers.update(SESSION_HEADERS)
+    # Keep connections to each provider host alive across downloads and absorb
+    # rate limiting and gateway errors below the provider fallback chain.
+    # Refused connections and timeouts are not retried: the chain already has
+    # another mirror or provider to try, and retrying them multiplies every
+    # timeout by the retry count.
+    retry = Retry(
+        total=5,
+        connect=0,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def resolve_provider_order(provider: str) -> Iterable[str]:
+    """Return the providers tried, in order, for a *provider* name or chain."""
+    provider = provider.lower()
+    if provider == "auto":
+        return AUTO_PROVIDER_ORDER
+    if provider == "auto_highres":
+        return AUTO_PROVIDER_ORDER_HIGHRES
+    if provider not in PROVIDER_LABELS:
+        raise ValueError(f"Invalid provider. Choose from: auto, auto_highres, {', '.join(PROVIDER_LABELS.keys())}")
+    return (provider,)
+
+
+def prewarm_session(session: requests.Session, provider: str = "auto") -> threading.Thread:
+    """Open pooled connections to *provider*'s hosts on a background thread.
+
+    DNS resolution and the TCP/TLS handshakes then overlap with local setup
+    instead of delaying the first download from each provider. Only hosts in
+    the resolved provider order are contacted.
+    """
+    urls = [PROVIDER_WARMUP_URLS[name] for name in resolve_provider_order(provider)]
+
+    def warm():
+        for url in urls:
+            try:
+                session.head(url, timeout=(CONNECT_TIMEOUT, 5)).close()
+            except requests.exceptions.RequestException:
+                continue
+
+    thread = threading.Thread(target=warm, name="sdo-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def _write_response_body(
+    response: requests.Response,
+    filepath: Path,
+    drop_cache: bool = False,
+    checksum: bool = False,
+) -> Optional[str]:
+    """Stream a response body to *filepath* in large blocks and publish it atomically.
+
+    The body lands in a ``.part`` file that is only moved into place once its
+    size matches ``Content-Length``, so readers never see a truncated image.
+    With *drop_cache*, the file is synced and the kernel is told it will not be
+    read back so its pages do not push hotter data out of the page cache
+    (Linux only).
+    With *checksum*, each block is hashed as it is written and the SHA-256 hex
+    digest of the body is returned.
+    """
+    partial_path = filepath.with_name(f"{filepath.name}.part")
+    expected = response.headers.get("Content-Length")
+    if response.headers.get("Content-Encoding", "identity") != "identity":
+        expected = None  # Content-Length counts encoded bytes
+
+    response.raw.decode_content = True
+    try:
+        # Unbuffered: the body already arrives in whole blocks, so a
+        # BufferedWriter would only add a second copy of every byte. A raw
+        # write may be partial, hence the inner loop.
+        with open(partial_path, "wb", buffering=0) as f:
+            digest = hashlib.sha256() if checksum else None
+            try:
+                while chunk := response.raw.read(DOWNLOAD_CHUNK_SIZE):
+                    if digest is not None:
+                        digest.update(chunk)
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[f.write(view):]
+            except Urllib3HTTPError as exc:
+                # Reading response.raw bypasses requests' exception mapping, so
+                # truncated or stalled bodies would otherwise escape the
+                # RequestException handlers that move on to the next mirror.
+                raise requests.exceptions.ConnectionError(exc, response=response) from exc
+            written = f.tell()
+            if drop_cache and hasattr(os, "posix_fadvise"):
+                # Dirty pages are not dropped, so write them back first.
+                os.fdatasync(f.fileno())
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+        # urllib3 2.x already raises on a short body (mapped above); urllib3 1.x
+        # does not enforce Content-Length, and this is the only check there.
+        if expected is not None and written != int(expected):
+            raise requests.exceptions.ConnectionError(
+                f"Incomplete download for {filepath.name}: {written} of {expected} bytes"
+            )
+        os.replace(partial_path, filepath)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+    return digest.hexdigest() if digest is not None else None
+
+
+def _write_json(filepath: Path, payload: Dict) -> None:
+    """Serialize *payload* once and write it to *filepath* in a single call."""
+    if orjson is not None:
+        filepath.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        filepath.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def _load_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _json_line(payload: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload) + b"\n"
+    return json.dumps(payload).encode("utf-8") + b"\n"
+
+
 class SDOProviderClient:
     """Download latest SDO imagery from multiple redundant providers."""
 
-    def __init__(self, output_dir: str = "sdo_data"):
+    def __init__(
+        self,
+        output_dir: str = "sdo_data",
+        skip_unchanged: bool = False,
+        metadata_manifest: bool = False,
+        session: Optional[requests.Session] = None,
+    ):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.session = requests.Session()
+        self.skip_unchanged = skip_unchanged
+        self.metadata_manifest = metadata_manifest
+        self._manifest_file = None
+        self._manifest_lock = threading.Lock()
+        self.session = session or create_session()
+        self._timestamp_cache: Dict[tuple, tuple] = {}
+        self._jsoc_times_cache: Optional[tuple] = None
+        self._helioviewer_dates_cache: Optional[tuple] = None
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self._last_seen: Dict[str, Dict] = {}
+        # (source, provider, width, image_type) -> (monotonic check time, result)
+        self._last_checked: Dict[tuple, tuple] = {}
+        self._last_digest: Dict[str, str] = {}
+        self._digests_lock = threading.Lock()
+        if skip_unchanged:
+            self._load_digests()
+
+    def prewarm_connections(self, provider: str = "auto") -> threading.Thread:
+        """Warm this client's session for *provider*; see prewarm_session()."""
+        return prewarm_session(self.session, provider)
+
+    def close(self):
+        """Flush and sync the metadata manifest, if one was opened."""
+        with self._manifest_lock:
+            if self._manifest_file is None:
+                return
+            self._manifest_file.flush()
+            os.fsync(self._manifest_file.fileno())
+            self._manifest_file.close()
+            self._manifest_file = None
+
+    def _load_digests(self):
+        """Restore the last saved image per source from a previous run."""
+        try:
+            saved = json.loads((self.output_dir / DIGESTS_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(saved, dict):
+            return
+        for source, metadata in saved.items():
+            # Skip malformed entries and only trust those whose image is still on disk.
+            if source not in VALID_SOURCES or not isinstance(metadata, dict):
+                continue
+            digest = metadata.get("sha256")
+            filepath = metadata.get("filepath")
+            if not isinstance(digest, str) or not isinstance(filepath, str) or not Path(filepath).exists():
+                continue
+            self._last_digest[source] = digest
+            self._last_seen[source] = metadata
+            if isinstance(metadata.get("image_url"), str) and metadata.get("last_modified"):
+                self._validators[metadata["image_url"]] = {"Last-Modified": metadata["last_modified"]}
+
+    def _save_digests(self, source: str, metadata: Dict):
+        """Record *metadata* as the last image for *source* and persist all digests."""
+        with self._digests_lock:
+            self._last_digest[source] = metadata["sha256"]
+            snapshot = {source: self._last_seen[source] for source in self._last_digest}
+            digests_path = self.output_dir / DIGESTS_NAME
+            partial_path = digests_path.with_name(f"{digests_path.name}.part")
+            _write_json(partial_path, snapshot)
+            os.replace(partial_path, digests_path)
+
+    def _append_manifest(self, metadata: Dict) -> Path:
+        manifest_path = self.output_dir / METADATA_MANIFEST_NAME
+        with self._manifest_lock:
+            if self._manifest_file is None:
+                self._manifest_file = open(manifest_path, "ab")
+            self._manifest_file.write(_json_line(metadata))
+            # The manifest is the only metadata a monitor keeps, so hand each
+            # record to the OS now; a killed process then loses nothing that
+            # was reported as saved. close() still fsyncs.
+            self._manifest_file.flush()
+        return manifest_path
 
     @staticmethod
     def _normalize_render_params(width: int, image_type: str) -> tuple[int, str]:
@@ -199,17 +441,17 @@ class SDOProviderClient:
         output_subdir: Optional[str] = None,
     ) -> Optional[Dict]:
         """Download the image closest to a requested UTC or local target time."""
-        if source not in SDO_SOURCES:
-            raise ValueError(f"Invalid source. Choose from: {list(SDO_SOURCES.keys())}")
+        if source not in VALID_SOURCES:
+            raise ValueError(f"Invalid source. Choose from: {SOURCE_KEYS}")
 
         width, image_type = self._normalize_render_params(width, image_type)
 
         target_dt = parse_target_datetime(target_time, timezone_mode=timezone_mode)
         source_info = SDO_SOURCES[source]
 
-        print(f"\nFetching {source} closest to {format_utc_datetime(target_dt)}...")
-        print(f"Wavelength: {source_info['wavelength']}")
-        print("Provider: Helioviewer API")
+        logger.info(f"Fetching {source} closest to {format_utc_datetime(target_dt)}...")
+        logger.info(f"Wavelength: {source_info['wavelength']}")
+        logger.info("Provider: Helioviewer API")
 
         info_response = self._request_with_retries(
             "https://api.helioviewer.org/v2/getClosestImage/",
@@ -217,10 +459,10 @@ class SDOProviderClient:
                 "date": format_utc_datetime(target_dt),
                 "sourceId": source_info["sourceId"],
             },
-            timeout=45,
+            timeout=(CONNECT_TIMEOUT, 45),
         )
         info_response.raise_for_status()
-        image_info = info_response.json()
+        image_info = _load_json(info_response)
         image_id = image_info.get("id")
 
         if not image_id:
@@ -233,19 +475,14 @@ class SDOProviderClient:
                 "width": width,
                 "type": image_type,
             },
-            timeout=90,
+            headers=IMAGE_REQUEST_HEADERS,
+            timeout=(CONNECT_TIMEOUT, 90),
             stream=True,
         )
         response.raise_for_status()
 
         target_dir = self.output_dir / output_subdir if output_subdir else self.output_dir
         target_dir.mkdir(parents=True, exist_ok=True)
-        filepath = target_dir / f"SDO_{source}_{utc_slug(target_dt)}.{image_type}"
-
-        with open(filepath, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
 
         actual_dt = _parse_helioviewer_datetime(image_info.get("date"))
         signed_delta = None
@@ -253,38 +490,30 @@ class SDOProviderClient:
         if actual_dt:
             signed_delta = (actual_dt - target_dt).total_seconds()
             abs_delta = abs(signed_delta)
+        observation_time = format_utc_datetime(actual_dt) if actual_dt else image_info.get("date")
 
-        metadata = {
-            "source": source,
-            "name": source_info["name"],
-            "wavelength": source_info["wavelength"],
-            "description": source_info["description"],
-            "provider": "helioviewer",
-            "provider_name": PROVIDER_LABELS["helioviewer"],
-            "filepath": str(filepath),
-            "download_time": datetime.now(timezone.utc).isoformat(),
-            "image_url": response.url,
-            "content_type": response.headers.get("Content-Type"),
-            "requested_time": format_utc_datetime(target_dt),
-            "observation_time": format_utc_datetime(actual_dt) if actual_dt else image_info.get("date"),
-            "actual_observation_time": format_utc_datetime(actual_dt) if actual_dt else image_info.get("date"),
-            "delta_seconds": signed_delta,
-            "abs_delta_seconds": abs_delta,
-            "image_id": image_id,
-            "image_width": width,
-            "image_type": image_type,
-            "helioviewer_metadata": image_info,
-        }
-
-        metadata_file = filepath.with_suffix(".json")
-        metadata["metadata_filepath"] = str(metadata_file)
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
-
-        print(f"✓ Image saved: {filepath}")
-        print(f"✓ Metadata saved: {metadata_file}")
+        metadata = self._store_download(
+            response=response,
+            source=source,
+            provider="helioviewer",
+            image_url=response.url,
+            directory=target_dir,
+            stem=f"SDO_{source}_{utc_slug(target_dt)}",
+            extension=f".{image_type}",
+            observation_time=observation_time,
+            extra_metadata={
+                "requested_time": format_utc_datetime(target_dt),
+                "actual_observation_time": observation_time,
+                "delta_seconds": signed_delta,
+                "abs_delta_seconds": abs_delta,
+                "image_id": image_id,
+                "image_width": width,
+                "image_type": image_type,
+                "helioviewer_metadata": image_info,
+            },
+        )
         if metadata["actual_observation_time"]:
-            print(f"✓ Observation time: {metadata['actual_observation_time']}")
+            logger.info(f"✓ Observation time: {metadata['actual_observation_time']}")
 
         return metadata
 
@@ -302,8 +531,8 @@ class SDOProviderClient:
     ) -> Dict:
         """Download a forward-only time series for the selected SDO sources."""
         if sources is None:
-            sources = list(SDO_SOURCES.keys())
-        invalid_sources = [source for source in sources if source not in SDO_SOURCES]
+            sources = list(SOURCE_KEYS)
+        invalid_sources = [source for source in sources if source not in VALID_SOURCES]
         if invalid_sources:
             raise ValueError(f"Invalid sources: {invalid_sources}")
         if hours <= 0:
@@ -330,32 +559,35 @@ class SDOProviderClient:
 
         for sample_time in sample_times:
             sample_subdir = f"{run_subdir}/{utc_slug(sample_time)}"
-            for source in sources:
+
+            # Every source of a sample hits the same Helioviewer host, so fetch
+            # them in parallel over the pooled keep-alive connections.
+            def fetch(source: str, sample_time: datetime = sample_time, sample_subdir: str = sample_subdir) -> Dict:
                 try:
-                    result = self.download_image_at(
-                        source=source,
-                        target_time=sample_time,
-                        timezone_mode="utc",
-                        width=width,
-                        image_type=image_type,
-                        output_subdir=sample_subdir,
-                    )
-                    if result:
-                        results.append(result)
-                        event = {"type": "result", "completed": completed + 1, "total": total, "result": result}
-                    else:
-                        error = {
-                            "source": source,
-                            "requested_time": format_utc_datetime(sample_time),
-                            "error": "No image found",
-                        }
-                        errors.append(error)
-                        event = {"type": "error", "completed": completed + 1, "total": total, "error": error}
+                    return {
+                        "result": self.download_image_at(
+                            source=source,
+                            target_time=sample_time,
+                            timezone_mode="utc",
+                            width=width,
+                            image_type=image_type,
+                            output_subdir=sample_subdir,
+                        )
+                    }
                 except Exception as exc:
+                    return {"exception": exc}
+
+            outcomes = fetch_sources_concurrently(fetch, sources)
+            for source, outcome in zip(sources, outcomes):
+                result = outcome.get("result")
+                if result:
+                    results.append(result)
+                    event = {"type": "result", "completed": completed + 1, "total": total, "result": result}
+                else:
                     error = {
                         "source": source,
                         "requested_time": format_utc_datetime(sample_time),
-                        "error": str(exc),
+                        "error": str(outcome["exception"]) if "exception" in outcome else "No image found",
                     }
                     errors.append(error)
                     event = {"type": "error", "completed": completed + 1, "total": total, "error": error}
@@ -384,28 +616,30 @@ class SDOProviderClient:
         }
         manifest_file = run_dir / "manifest.json"
         manifest["manifest_filepath"] = str(manifest_file)
-        with open(manifest_file, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2)
+        _write_json(manifest_file, manifest)
 
-        print(f"\n✓ Historical fetch complete: {len(results)}/{total} images")
-        print(f"✓ Manifest saved: {manifest_file}")
+        logger.info(f"✓ Historical fetch complete: {len(results)}/{total} images")
+        logger.info(f"✓ Manifest saved: {manifest_file}")
         return manifest
 
     def _request_with_retries(self, url: str, retries: int = 2, **kwargs) -> requests.Response:
-        last_error = None
+        """GET *url*, retrying dropped connections and timeouts *retries* times.
+
+        The session itself does not retry those, because the latest-image
+        providers fall through to the next mirror instead. Historical fetches
+        are Helioviewer-only and have nothing to fall back to.
+        """
         for attempt in range(retries + 1):
             try:
                 response = self.session.get(url, **kwargs)
                 response.raise_for_status()
                 return response
-            except requests.exceptions.RequestException as exc:
-                last_error = exc
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
                 if attempt >= retries:
                     raise
                 wait_seconds = 1 + attempt
-                print(f"Helioviewer request failed, retrying in {wait_seconds}s: {exc}")
+                logger.warning(f"Helioviewer request failed, retrying in {wait_seconds}s: {exc}")
                 time.sleep(wait_seconds)
-        raise last_error
 
     def download_latest_image(
         self,
@@ -415,87 +649,91 @@ class SDOProviderClient:
         image_type: str = "png",
     ) -> Optional[Dict]:
         """Download the latest image using the requested provider or fallback chain."""
-        if source not in SDO_SOURCES:
-            raise ValueError(f"Invalid source. Choose from: {list(SDO_SOURCES.keys())}")
+        if source not in VALID_SOURCES:
+            raise ValueError(f"Invalid source. Choose from: {SOURCE_KEYS}")
 
         width, image_type = self._normalize_render_params(width, image_type)
         provider_order = self._resolve_provider_order(provider)
 
-        print(f"\nFetching latest {source} image...")
-        print(f"Wavelength: {SDO_SOURCES[source]['wavelength']}")
-        print(f"Provider order: {', '.join(provider_order)}")
+        request_key = (source, provider.lower(), width, image_type)
+        checked_at, previous = self._last_checked.get(request_key, (0.0, None))
+        if (
+            self.skip_unchanged
+            and previous
+            and time.monotonic() - checked_at < LATEST_RECHECK_SECONDS
+        ):
+            logger.info(f"• {source} was checked less than {LATEST_RECHECK_SECONDS}s ago, reusing last result")
+            return {**previous, "unchanged": True}
+
+        logger.info(f"Fetching latest {source} image...")
+        logger.info(f"Wavelength: {SDO_SOURCES[source]['wavelength']}")
+        logger.info(f"Provider order: {', '.join(provider_order)}")
 
         last_error = None
 
         for provider_name in provider_order:
             try:
-                print(f"Trying provider: {PROVIDER_LABELS[provider_name]}")
+                logger.info(f"Trying provider: {PROVIDER_LABELS[provider_name]}")
                 result = getattr(self, f"_download_from_{provider_name}")(source, width=width, image_type=image_type)
                 if result:
+                    self._last_checked[request_key] = (time.monotonic(), result)
                     return result
             except requests.exceptions.RequestException as e:
                 last_error = e
-                print(f"Provider {provider_name} failed: {e}")
+                logger.info(f"Provider {provider_name} failed: {e}")
             except Exception as e:
                 last_error = e
-                print(f"Provider {provider_name} failed unexpectedly: {e}")
+                logger.warning(f"Provider {provider_name} failed unexpectedly: {e}")
 
         if last_error:
-            print(f"All providers failed. Last error: {last_error}")
+            logger.warning(f"All providers failed. Last error: {last_error}")
         else:
-            print("All providers failed.")
+            logger.warning("All providers failed.")
         return None
 
     def get_latest_timestamp(self, source: str = "AIA_171", provider: str = "auto") -> Optional[str]:
         """Best-effort timestamp lookup using the same provider order."""
-        if source not in SDO_SOURCES:
-            raise ValueError(f"Invalid source. Choose from: {list(SDO_SOURCES.keys())}")
+        if source not in VALID_SOURCES:
+            raise ValueError(f"Invalid source. Choose from: {SOURCE_KEYS}")
+
+        cache_key = (source, provider.lower())
+        cached = self._timestamp_cache.get(cache_key)
+        if cached and time.monotonic() - cached[1] < TIMESTAMP_CACHE_SECONDS:
+            return cached[0]
 
         for provider_name in self._resolve_provider_order(provider):
             try:
                 timestamp = getattr(self, f"_timestamp_from_{provider_name}")(source)
                 if timestamp:
+                    self._timestamp_cache[cache_key] = (timestamp, time.monotonic())
                     return timestamp
             except Exception:
                 continue
         return None
 
-    @staticmethod
-    def list_providers():
-        """Print available provider names."""
-        print("\nAvailable data providers:")
-        print("=" * 60)
-        print("auto         - Automatic fallback chain")
-        print("auto_highres - High-resolution fallback chain")
-        for key, label in PROVIDER_LABELS.items():
-            print(f"{key:12} - {label}")
+    list_providers = staticmethod(list_providers)
 
     def _resolve_provider_order(self, provider: str) -> Iterable[str]:
-        provider = provider.lower()
-        if provider == "auto":
-            return AUTO_PROVIDER_ORDER
-        if provider == "auto_highres":
-            return AUTO_PROVIDER_ORDER_HIGHRES
-        if provider not in PROVIDER_LABELS:
-            raise ValueError(f"Invalid provider. Choose from: auto, auto_highres, {', '.join(PROVIDER_LABELS.keys())}")
-        return (provider,)
+        return resolve_provider_order(provider)
 
     def _download_from_lmsal(self, source: str, width: int = 1024, image_type: str = "png") -> Optional[Dict]:
-        code = SDO_SOURCES[source].get("lmsal_code")
-        if not code:
+        templates = LMSAL_URL_TEMPLATES.get(source)
+        if not templates:
             return None
 
+        # A scheme that cannot be reached for today's date will not be reachable
+        # for earlier dates either, so each one costs at most one timeout.
+        unreachable = set()
         for day_offset in range(0, 4):
             candidate_date = datetime.now(timezone.utc) - timedelta(days=day_offset)
             date_path = candidate_date.strftime("%Y/%m/%d")
-            urls = [
-                f"http://suntoday.lmsal.com/sdomedia/SunInTime/{date_path}/t{code}.jpg",
-                f"https://suntoday.lmsal.com/sdomedia/SunInTime/{date_path}/t{code}.jpg",
-            ]
 
-            for url in urls:
+            for template in templates:
+                if template in unreachable:
+                    continue
+                url = template.format(date_path=date_path)
                 try:
-                    response = self.session.get(url, timeout=30, stream=True)
+                    response = self.session.get(url, headers=IMAGE_REQUEST_HEADERS, timeout=(CONNECT_TIMEOUT, 30), stream=True)
                     if response.status_code == 404:
                         response.close()
                         continue
@@ -516,18 +754,18 @@ class SDOProviderClient:
                             "resolution_class": "browse_fixed",
                         },
                     )
+                except requests.exceptions.ConnectionError:
+                    unreachable.add(template)
                 except requests.exceptions.RequestException:
                     continue
 
         return None
 
     def _download_from_jsoc(self, source: str, width: int = 1024, image_type: str = "png") -> Optional[Dict]:
-        jsoc_path = SDO_SOURCES[source].get("jsoc_path")
-        if not jsoc_path:
+        url = JSOC_LATEST_URLS.get(source)
+        if not url:
             return None
-
-        url = f"https://jsoc1.stanford.edu{jsoc_path}"
-        response = self.session.get(url, timeout=30, stream=True)
+        response = self.session.get(url, headers=IMAGE_REQUEST_HEADERS, timeout=(CONNECT_TIMEOUT, 30), stream=True)
         response.raise_for_status()
 
         return self._save_response(
@@ -535,7 +773,7 @@ class SDOProviderClient:
             source=source,
             provider="jsoc",
             image_url=url,
-            extension=Path(jsoc_path).suffix or ".img",
+            extension=Path(SDO_SOURCES[source]["jsoc_path"]).suffix or ".img",
             observation_time=self._timestamp_from_jsoc(source),
             extra_metadata={
                 "requested_image_width": width,
@@ -546,21 +784,24 @@ class SDOProviderClient:
         )
 
     def _download_from_nasa(self, source: str, width: int = 1024, image_type: str = "png") -> Optional[Dict]:
-        nasa_code = SDO_SOURCES[source].get("nasa_code")
-        if not nasa_code:
+        urls = NASA_LATEST_URLS.get(source)
+        if not urls:
             return None
 
-        urls = [
-            f"http://sdo.gsfc.nasa.gov/assets/img/latest/latest_1024_{nasa_code}.jpg",
-            f"https://sdo.gsfc.nasa.gov/assets/img/latest/latest_1024_{nasa_code}.jpg",
-        ]
-
+        previous = self._last_seen.get(source)
         for url in urls:
+            headers = IMAGE_REQUEST_HEADERS
+            if self.skip_unchanged and previous and previous["image_url"] == url:
+                headers = {**IMAGE_REQUEST_HEADERS, **self._conditional_headers(url)}
             try:
-                response = self.session.get(url, timeout=30, stream=True)
+                response = self.session.get(url, headers=headers, timeout=(CONNECT_TIMEOUT, 30), stream=True)
                 response.raise_for_status()
+                if response.status_code == 304:
+                    response.close()
+                    logger.info(f"• No new {source} data since {previous['observation_time']}, skipping download")
+                    return {**previous, "unchanged": True}
 
-                return self._save_response(
+                result = self._save_response(
                     response=response,
                     source=source,
                     provider="nasa",
@@ -574,6 +815,10 @@ class SDOProviderClient:
                         "resolution_class": "browse_fixed",
                     },
                 )
+                if self.skip_unchanged:
+                    # Only after the image is on disk, so a 304 always has a saved copy behind it.
+                    self._remember_validators(url, response)
+                return result
             except requests.exceptions.RequestException:
                 continue
 
@@ -582,29 +827,43 @@ class SDOProviderClient:
     def _download_from_helioviewer(self, source: str, width: int = 1024, image_type: str = "png") -> Optional[Dict]:
         width, image_type = self._normalize_render_params(width, image_type)
         source_id = SDO_SOURCES[source]["sourceId"]
-        info_response = self._request_with_retries(
+        info_response = self.session.get(
             "https://api.helioviewer.org/v2/getClosestImage/",
             params={
                 "date": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
                 "sourceId": source_id,
             },
-            timeout=30,
+            timeout=(CONNECT_TIMEOUT, 30),
         )
         info_response.raise_for_status()
-        image_info = info_response.json()
+        image_info = _load_json(info_response)
         image_id = image_info.get("id")
 
         if not image_id:
             return None
 
-        response = self._request_with_retries(
+        # Decide before downloadImage, which makes the server render the image.
+        previous = self._last_seen.get(source)
+        if (
+            self.skip_unchanged
+            and previous
+            and previous["provider"] == "helioviewer"
+            and previous.get("image_id") == image_id
+            and previous.get("image_width") == width
+            and previous.get("image_type") == image_type
+        ):
+            logger.info(f"• No new {source} data since {previous['observation_time']}, skipping download")
+            return {**previous, "unchanged": True}
+
+        response = self.session.get(
             "https://api.helioviewer.org/v2/downloadImage/",
             params={
                 "id": image_id,
                 "width": width,
                 "type": image_type,
             },
-            timeout=90,
+            headers=IMAGE_REQUEST_HEADERS,
+            timeout=(CONNECT_TIMEOUT, 90),
             stream=True,
         )
         response.raise_for_status()
@@ -628,22 +887,23 @@ class SDOProviderClient:
         )
 
     def _timestamp_from_lmsal(self, source: str) -> Optional[str]:
-        code = SDO_SOURCES[source].get("lmsal_code")
-        if not code:
+        templates = LMSAL_URL_TEMPLATES.get(source)
+        if not templates:
             return None
 
+        unreachable = set()
         for day_offset in range(0, 4):
             candidate_date = datetime.now(timezone.utc) - timedelta(days=day_offset)
             date_path = candidate_date.strftime("%Y/%m/%d")
-            urls = [
-                f"http://suntoday.lmsal.com/sdomedia/SunInTime/{date_path}/t{code}.jpg",
-                f"https://suntoday.lmsal.com/sdomedia/SunInTime/{date_path}/t{code}.jpg",
-            ]
-            for url in urls:
+            for template in templates:
+                if template in unreachable:
+                    continue
                 try:
-                    response = self.session.head(url, timeout=15)
+                    response = self.session.head(template.format(date_path=date_path), timeout=(CONNECT_TIMEOUT, 15))
                     if response.status_code == 200:
                         return response.headers.get("Last-Modified") or candidate_date.strftime("%Y-%m-%d")
+                except requests.exceptions.ConnectionError:
+                    unreachable.add(template)
                 except requests.exceptions.RequestException:
                     continue
         return None
@@ -653,31 +913,60 @@ class SDOProviderClient:
         if not timestamp_key:
             return None
 
+        return self._jsoc_image_times().get(timestamp_key)
+
+    def _jsoc_image_times(self) -> Dict[str, str]:
+        """Fetch and index the JSOC latest-image time listing, shared by every HMI source."""
+        cached = self._jsoc_times_cache
+        if cached and time.monotonic() - cached[1] < TIMESTAMP_CACHE_SECONDS:
+            return cached[0]
+
         url = "https://jsoc1.stanford.edu/data/hmi/images/latest/image_times_UTC"
-        response = self.session.get(url, timeout=15)
+        headers = self._conditional_headers(url) if cached else {}
+        response = self.session.get(url, headers=headers, timeout=(CONNECT_TIMEOUT, 15))
+        if cached and response.status_code == 304:
+            self._jsoc_times_cache = (cached[0], time.monotonic())
+            return cached[0]
         response.raise_for_status()
+        self._remember_validators(url, response)
 
+        image_times = {}
         for line in response.text.splitlines():
             if ":" not in line:
                 continue
             key, value = line.split(":", 1)
-            if key.strip().lower() == timestamp_key:
-                return value.strip()
-        return None
+            image_times.setdefault(key.strip().lower(), value.strip())
+
+        self._jsoc_times_cache = (image_times, time.monotonic())
+        return image_times
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from the last response for *url*."""
+        validators = self._validators.get(url, {})
+        headers = {}
+        if validators.get("ETag"):
+            headers["If-None-Match"] = validators["ETag"]
+        if validators.get("Last-Modified"):
+            headers["If-Modified-Since"] = validators["Last-Modified"]
+        return headers
+
+    def _remember_validators(self, url: str, response: requests.Response) -> None:
+        validators = {
+            name: response.headers[name]
+            for name in ("ETag", "Last-Modified")
+            if response.headers.get(name)
+        }
+        if validators:
+            self._validators[url] = validators
 
     def _timestamp_from_nasa(self, source: str) -> Optional[str]:
-        nasa_code = SDO_SOURCES[source].get("nasa_code")
-        if not nasa_code:
+        urls = NASA_LATEST_URLS.get(source)
+        if not urls:
             return None
 
-        urls = [
-            f"http://sdo.gsfc.nasa.gov/assets/img/latest/latest_1024_{nasa_code}.jpg",
-            f"https://sdo.gsfc.nasa.gov/assets/img/latest/latest_1024_{nasa_code}.jpg",
-        ]
-
         for url in urls:
             try:
-                response = self.session.head(url, timeout=15)
+                response = self.session.head(url, timeout=(CONNECT_TIMEOUT, 15))
                 response.raise_for_status()
                 return response.headers.get("Last-Modified")
             except requests.exceptions.RequestException:
@@ -687,16 +976,50 @@ class SDOProviderClient:
 
     def _timestamp_from_helioviewer(self, source: str) -> Optional[str]:
         source_id = SDO_SOURCES[source]["sourceId"]
+        try:
+            latest = self._helioviewer_latest_dates().get(source_id)
+        except (requests.exceptions.RequestException, ValueError):
+            latest = None
+        if latest:
+            return latest
+
         response = self.session.get(
             "https://api.helioviewer.org/v2/getClosestImage/",
             params={
                 "date": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
                 "sourceId": source_id,
             },
-            timeout=15,
+            timeout=(CONNECT_TIMEOUT, 15),
         )
         response.raise_for_status()
-        return response.json().get("date")
+        return _load_json(response).get("date")
+
+    def _helioviewer_latest_dates(self) -> Dict[int, str]:
+        """Map every Helioviewer sourceId to its latest observation date with one request."""
+        cached = self._helioviewer_dates_cache
+        if cached and time.monotonic() - cached[1] < DATA_SOURCES_CACHE_SECONDS:
+            return cached[0]
+
+        response = self.session.get(
+            "https://api.helioviewer.org/v2/getDataSources/",
+            timeout=(CONNECT_TIMEOUT, 30),
+        )
+        response.raise_for_status()
+
+        latest_dates = {}
+        pending = [_load_json(response)]
+        while pending:
+            node = pending.pop()
+            if not isinstance(node, dict):
+                continue
+            if "sourceId" in node:
+                if node.get("end"):
+                    latest_dates[int(node["sourceId"])] = node["end"]
+                continue
+            pending.extend(node.values())
+
+        self._helioviewer_dates_cache = (latest_dates, time.monotonic())
+        return latest_dates
 
     def _save_response(
         self,
@@ -708,13 +1031,77 @@ class SDOProviderClient:
         observation_time: Optional[str] = None,
         extra_metadata: Optional[Dict] = None,
     ) -> Dict:
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        filepath = self.output_dir / f"SDO_{source}_{timestamp}{extension}"
+        previous = self._last_seen.get(source)
+        if (
+            self.skip_unchanged
+            and observation_time
+            and previous
+            and previous["provider"] == provider
+            and previous["image_url"] == image_url
+            and previous["observation_time"] == observation_time
+        ):
+            response.close()
+            logger.info(f"• No new {source} data since {observation_time}, skipping download")
+            return {**previous, "unchanged": True}
+
+        timestamp, download_time = _utc_stamps()
+        metadata = self._store_download(
+            response=response,
+            source=source,
+            provider=provider,
+            image_url=image_url,
+            directory=self.output_dir,
+            stem=f"SDO_{source}_{timestamp}",
+            extension=extension,
+            observation_time=observation_time,
+            extra_metadata=extra_metadata,
+            download_time=download_time,
+            # Latest images are written once and never re-read by this tool.
+            drop_cache=True,
+            use_manifest=self.metadata_manifest,
+            known_digest=self._last_digest.get(source) if previous else None,
+            known_filepath=previous["filepath"] if previous else None,
+        )
+        if metadata is None:
+            logger.info(f"• {source} image is identical to the last download, discarded it")
+            return {**previous, "unchanged": True}
+        logger.info(f"✓ Provider used: {PROVIDER_LABELS[provider]}")
+
+        self._last_seen[source] = metadata
+        if self.skip_unchanged:
+            self._save_digests(source, metadata)
+        return metadata
 
-        with open(filepath, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+    def _store_download(
+        self,
+        response: requests.Response,
+        source: str,
+        provider: str,
+        image_url: str,
+        directory: Path,
+        stem: str,
+        extension: str,
+        observation_time: Optional[str] = None,
+        extra_metadata: Optional[Dict] = None,
+        drop_cache: bool = False,
+        use_manifest: bool = False,
+        known_digest: Optional[str] = None,
+        known_filepath: Optional[str] = None,
+        download_time: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """Write an image response to *directory*/*stem*+*extension* and record its metadata.
+
+        The sidecar, when written, shares the image's stem. With skip_unchanged,
+        the body's SHA-256 is recorded as ``sha256``; if it equals *known_digest*
+        the new file is removed and ``None`` is returned.
+        """
+        filepath = directory / f"{stem}{extension}"
+        digest = _write_response_body(response, filepath, drop_cache=drop_cache, checksum=self.skip_unchanged)
+        if digest is not None and digest == known_digest:
+            # A download in the same second as the known one reuses its name.
+            if str(filepath) != known_filepath:
+                filepath.unlink(missing_ok=True)
+            return None
 
         metadata = {
             "source": source,
@@ -724,23 +1111,27 @@ class SDOProviderClient:
             "provider": provider,
             "provider_name": PROVIDER_LABELS[provider],
             "filepath": str(filepath),
-            "download_time": datetime.now(timezone.utc).isoformat(),
+            "download_time": download_time or _utc_stamps()[1],
             "image_url": image_url,
             "observation_time": observation_time,
             "content_type": response.headers.get("Content-Type"),
             "last_modified": response.headers.get("Last-Modified"),
         }
+        if digest is not None:
+            metadata["sha256"] = digest
 
         if extra_metadata:
             metadata.update(extra_metadata)
 
-        metadata_file = filepath.with_suffix(".json")
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
-
-        print(f"✓ Image saved: {filepath}")
-        print(f"✓ Metadata saved: {metadata_file}")
-        print(f"✓ Provider used: {PROVIDER_LABELS[provider]}")
+        logger.info(f"✓ Image saved: {filepath}")
+        if use_manifest:
+            manifest_path = self._append_manifest(metadata)
+            logger.info(f"✓ Metadata appended: {manifest_path}")
+        else:
+            metadata_file = directory / f"{stem}.json"
+            metadata["metadata_filepath"] = str(metadata_file)
+            _write_json(metadata_file, metadata)
+            logger.info(f"✓ Metadata saved: {metadata_file}")
 
         return metadata
 
@@ -774,7 +1165,7 @@ def generate_video_for_source(
         [d for d in job_path.iterdir() if d.is_dir() and d.name != "videos"],
         key=lambda d: d.name,
     )
-    print(f"[Video] {source_key}: scanning {len(timestamp_dirs)} timestamp dirs...")
+    logger.info(f"[Video] {source_key}: scanning {len(timestamp_dirs)} timestamp dirs...")
 
     # Gather frames for this source
     frames_paths: list[Path] = []
@@ -786,7 +1177,7 @@ def generate_video_for_source(
                 break  # one frame per timestamp per source
 
     if len(frames_paths) < 2:
-        print(f"[Video] {source_key}: only {len(frames_paths)} frame(s) found, skipping (need >= 2)")
+        logger.info(f"[Video] {source_key}: only {len(frames_paths)} frame(s) found, skipping (need >= 2)")
         return None
 
     # Read frames, normalising to RGB
@@ -796,7 +1187,7 @@ def generate_video_for_source(
         try:
             img = iio.imread(fp)
         except Exception as exc:
-            print(f"[Video] {source_key}: failed to read {fp.name}: {exc}")
+            logger.warning(f"[Video] {source_key}: failed to read {fp.name}: {exc}")
             continue
         # Convert grayscale to RGB
         if img.ndim == 2:
@@ -813,10 +1204,10 @@ def generate_video_for_source(
         if img.shape[:2] == target_hw:
             frames.append(np.ascontiguousarray(img, dtype=np.uint8))
 
-    print(f"[Video] {source_key}: {len(frames_paths)} frames found, {len(frames)} valid after normalization")
+    logger.info(f"[Video] {source_key}: {len(frames_paths)} frames found, {len(frames)} valid after normalization")
 
     if len(frames) < 2:
-        print(f"[Video] {source_key}: fewer than 2 valid frames, skipping")
+        logger.info(f"[Video] {source_key}: fewer than 2 valid frames, skipping")
         return None
 
     # Stack into a single (T, H, W, 3) array for the encoder. yuv420p requires
@@ -835,8 +1226,8 @@ def generate_video_for_source(
     wavelength_label = source_info.get("wavelength", source_key).replace("Å", "A")
     output_path = video_dir / f"SDO_{source_key}_{wavelength_label}_timelapse.mp4"
 
-    print(f"[Video] {source_key}: encoding {video_array.shape[0]} frames "
-          f"({video_array.shape[2]}x{video_array.shape[1]}) @ {fps} fps...")
+    logger.info(f"[Video] {source_key}: encoding {video_array.shape[0]} frames "
+                f"({video_array.shape[2]}x{video_array.shape[1]}) @ {fps} fps...")
     iio.imwrite(
         output_path,
         video_array,
@@ -846,7 +1237,7 @@ def generate_video_for_source(
         out_pixel_format="yuv420p",
     )
 
-    print(f"✓ Video saved: {output_path} ({video_array.shape[0]} frames @ {fps} fps)")
+    logger.info(f"✓ Video saved: {output_path} ({video_array.shape[0]} frames @ {fps} fps)")
     return str(output_path)
 
 
@@ -868,9 +1259,9 @@ def generate_videos_for_job(
         if manifest_file.exists():
             with open(manifest_file, "r", encoding="utf-8") as f:
                 manifest = json.load(f)
-            sources = manifest.get("sources", list(SDO_SOURCES.keys()))
+            sources = manifest.get("sources", list(SOURCE_KEYS))
         else:
-            sources = list(SDO_SOURCES.keys())
+            sources = list(SOURCE_KEYS)
 
     total = len(sources)
     completed = 0
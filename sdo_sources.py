@@ -0,0 +1,134 @@
+"""
+SDO source and provider catalog.
+
+Kept free of third-party imports so that listing sources and providers does
+not pay for loading the HTTP stack.
+"""
+
+
+SDO_SOURCES = {
+    "AIA_94": {
+        "sourceId": 8,
+        "name": "AIA 94",
+        "wavelength": "94Å",
+        "description": "AIA 94 Å - Hot flare plasma",
+        "nasa_code": "0094",
+        "lmsal_code": "0094",
+    },
+    "AIA_131": {
+        "sourceId": 9,
+        "name": "AIA 131",
+        "wavelength": "131Å",
+        "description": "AIA 131 Å - Flaring regions",
+        "nasa_code": "0131",
+        "lmsal_code": "0131",
+    },
+    "AIA_171": {
+        "sourceId": 10,
+        "name": "AIA 171",
+        "wavelength": "171Å",
+        "description": "AIA 171 Å - Quiet corona and coronal loops",
+        "nasa_code": "0171",
+        "lmsal_code": "0171",
+    },
+    "AIA_193": {
+        "sourceId": 11,
+        "name": "AIA 193",
+        "wavelength": "193Å",
+        "description": "AIA 193 Å - Hot plasma in active regions",
+        "nasa_code": "0193",
+        "lmsal_code": "0193",
+    },
+    "AIA_211": {
+        "sourceId": 12,
+        "name": "AIA 211",
+        "wavelength": "211Å",
+        "description": "AIA 211 Å - Active regions",
+        "nasa_code": "0211",
+        "lmsal_code": "0211",
+    },
+    "AIA_304": {
+        "sourceId": 13,
+        "name": "AIA 304",
+        "wavelength": "304Å",
+        "description": "AIA 304 Å - Chromosphere and prominence",
+        "nasa_code": "0304",
+        "lmsal_code": "0304",
+    },
+    "AIA_335": {
+        "sourceId": 14,
+        "name": "AIA 335",
+        "wavelength": "335Å",
+        "description": "AIA 335 Å - Active regions",
+        "nasa_code": "0335",
+        "lmsal_code": "0335",
+    },
+    "AIA_1600": {
+        "sourceId": 15,
+        "name": "AIA 1600",
+        "wavelength": "1600Å",
+        "description": "AIA 1600 Å - Upper photosphere",
+        "nasa_code": "1600",
+        "lmsal_code": "1600",
+    },
+    "AIA_1700": {
+        "sourceId": 16,
+        "name": "AIA 1700",
+        "wavelength": "1700Å",
+        "description": "AIA 1700 Å - Temperature minimum",
+        "nasa_code": "1700",
+        "lmsal_code": "1700",
+    },
+    "AIA_4500": {
+        "sourceId": 17,
+        "name": "AIA 4500",
+        "wavelength": "4500Å",
+        "description": "AIA 4500 Å - Visible light photosphere",
+        "nasa_code": "4500",
+        "lmsal_code": "4500",
+    },
+    "HMI_Continuum": {
+        "sourceId": 18,
+        "name": "HMI Continuum",
+        "wavelength": "Continuum",
+        "description": "HMI Continuum - Solar surface",
+        "nasa_code": "HMIIC",
+        "lmsal_code": "_HMI_cont_aiascale",
+        "jsoc_path": "/data/hmi/images/latest/HMI_latest_Int_1024x1024.gif",
+        "jsoc_timestamp_key": "continuum",
+    },
+    "HMI_Magnetogram": {
+        "sourceId": 19,
+        "name": "HMI Magnetogram",
+        "wavelength": "Magnetogram",
+        "description": "HMI Magnetogram - Magnetic field",
+        "nasa_code": "HMII",
+        "lmsal_code": "_HMImag",
+        "jsoc_path": "/data/hmi/images/latest/HMI_latest_Mag_1024x1024.gif",
+        "jsoc_timestamp_key": "magnetogram",
+    },
+}
+
+
+# Source keys as a set for membership checks and in declaration order for
+# defaults and error messages.
+VALID_SOURCES = frozenset(SDO_SOURCES)
+SOURCE_KEYS = tuple(SDO_SOURCES)
+
+
+PROVIDER_LABELS = {
+    "lmsal": "LMSAL Sun Today",
+    "jsoc": "Stanford JSOC",
+    "nasa": "NASA SDO",
+    "helioviewer": "Helioviewer API",
+}
+
+
+def list_providers():
+    """Print available provider names."""
+    print("\nAvailable data providers:")
+    print("=" * 60)
+    print("auto         - Automatic fallback chain")
+    print("auto_highres - High-resolution fallback chain")
+    for key, label in PROVIDER_LABELS.items():
+        print(f"{key:12} - {label}")
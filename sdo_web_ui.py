@@ -9,6 +9,7 @@ from datetime import datetime, timezone
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import json
+import logging
 from pathlib import Path
 import threading
 import time
@@ -18,6 +19,8 @@ from urllib.parse import unquote, urlparse
 from sdo_provider import (
     SDOProviderClient,
     SDO_SOURCES,
+    SOURCE_KEYS,
+    VALID_SOURCES,
     generate_videos_for_job,
     parse_target_datetime,
 )
@@ -1294,12 +1297,12 @@ def validate_fetch_payload(payload: Dict) -> Dict:
         raise ValueError(f"width must be between 1 and {MAX_WIDTH}")
 
     if payload.get("all_sources", True):
-        sources = list(SDO_SOURCES.keys())
+        sources = list(SOURCE_KEYS)
     else:
         sources = [str(source) for source in payload.get("sources", [])]
     if not sources:
         raise ValueError("Select at least one source")
-    invalid = [source for source in sources if source not in SDO_SOURCES]
+    invalid = [source for source in sources if source not in VALID_SOURCES]
     if invalid:
         raise ValueError(f"Invalid sources: {invalid}")
 
@@ -1425,7 +1428,7 @@ class SDORequestHandler(BaseHTTPRequestHandler):
             return
 
         if parsed.path == "/api/sources":
-            json_response(self, {"sources": list(SDO_SOURCES.keys())})
+            json_response(self, {"sources": list(SOURCE_KEYS)})
             return
 
         if parsed.path.startswith("/api/job/"):
@@ -1622,6 +1625,7 @@ class SDORequestHandler(BaseHTTPRequestHandler):
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     server = ThreadingHTTPServer((HOST, PORT), SDORequestHandler)
     print(f"SDO Solar Moment Console running at http://{HOST}:{PORT}")